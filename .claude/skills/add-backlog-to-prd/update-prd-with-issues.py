@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
-import copy
+import argparse
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 _bot_dir = os.path.join(_script_dir, "..", "..", "..")
@@ -15,38 +17,68 @@ _config = load_config()
 _issue_repo = require_config(_config, "project.issueRepository")
 _project_name = require_config(_config, "project.name")
 
+_BRAVE_DIR = os.path.join(_bot_dir, "..", "src", "brave")
+_CHROMIUM_DIR = os.path.join(_bot_dir, "..", "src")
+TEST_LOCATION_CACHE_PATH = os.path.join(_bot_dir, ".ignore", "test-location-cache.json")
+
+# Resolve git once instead of a PATH search per lookup, and skip locale
+# setup in each short-lived git process
+_GIT = shutil.which("git") or "git"
+_GIT_ENV = {**os.environ, "LC_ALL": "C"}
+# git grep defaults to 8 worker threads regardless of the machine
+_GIT_GREP = (_GIT, "grep", "--threads", str(os.cpu_count() or 8))
+
+ISSUE_RE = re.compile(r"issue #(\d+)")
+# Matches "Test failure:", "Intermittent test failure:", etc. title prefixes
+TEST_FAILURE_PREFIX_RE = re.compile(r"^.*?failure:\s*", re.IGNORECASE)
+
+# Test classes with these prefixes only exist in src/brave, so they don't
+# need to be looked up
+_BRAVE_TEST_PREFIXES = ("Brave",)
+
+# test class name -> location, so issues sharing a test class only grep once
+_test_location_cache = {}
+_test_location_cache_key = None
+
 
 def find_test_location(test_class_name):
     """
     Determine if a test is a Brave test or Chromium test by running git grep.
     Returns 'brave' if found in src/brave, 'chromium' if found in src only, or 'unknown'.
+    Results are memoized for the lifetime of the script.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    brave_dir = os.path.join(script_dir, "..", "..", "..", "..", "src", "brave")
-    chromium_dir = os.path.join(script_dir, "..", "..", "..", "..", "src")
+    if test_class_name.startswith(_BRAVE_TEST_PREFIXES):
+        return "brave"
+    if test_class_name not in _test_location_cache:
+        _test_location_cache[test_class_name] = _grep_test_location(test_class_name)
+    return _test_location_cache[test_class_name]
 
+
+def _grep_test_location(test_class_name):
     try:
         result = subprocess.run(
-            ["git", "grep", "-l", test_class_name],
-            cwd=brave_dir,
-            capture_output=True,
-            text=True,
+            [*_GIT_GREP, "-q", "-F", "-w", test_class_name],
+            cwd=_BRAVE_DIR,
+            env=_GIT_ENV,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
-        if result.returncode == 0 and result.stdout.strip():
+        if result.returncode == 0:
             return "brave"
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
 
     try:
         result = subprocess.run(
-            ["git", "grep", "-l", test_class_name, "--", ".", ":!brave"],
-            cwd=chromium_dir,
-            capture_output=True,
-            text=True,
+            [*_GIT_GREP, "-q", "-F", "-w", test_class_name, "--", ".", ":!brave"],
+            cwd=_CHROMIUM_DIR,
+            env=_GIT_ENV,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
-        if result.returncode == 0 and result.stdout.strip():
+        if result.returncode == 0:
             return "chromium"
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
@@ -54,6 +86,140 @@ def find_test_location(test_class_name):
     return "unknown"
 
 
+def _grep_test_classes(test_class_names, cwd, pathspec=()):
+    """Return the subset of test_class_names that git grep finds under cwd.
+
+    All names are searched in a single git grep invocation. Returns None if
+    the grep could not be run, so callers can fall back to per-class lookups.
+    """
+    cmd = [*_GIT_GREP, "-h", "-o", "-F", "-w"]
+    for name in test_class_names:
+        cmd += ["-e", name]
+    if pathspec:
+        cmd += ["--", *pathspec]
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=cwd,
+            env=_GIT_ENV,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    # git grep exits 1 when nothing matched, anything else is an error
+    if result.returncode not in (0, 1):
+        return None
+    return set(result.stdout.split()) & set(test_class_names)
+
+
+def prefetch_test_locations(test_class_names):
+    """Resolve many test classes with one git grep per source tree.
+
+    Seeds the find_test_location cache. Names that contain another requested
+    name are skipped, since git grep -o only reports the shorter match for
+    them; find_test_location resolves those individually.
+    """
+    pending = sorted(
+        {
+            name
+            for name in test_class_names
+            if name not in _test_location_cache
+            and not name.startswith(_BRAVE_TEST_PREFIXES)
+        }
+    )
+    batch = [
+        name
+        for name in pending
+        if not any(other != name and other in name for other in pending)
+    ]
+    if not batch:
+        return
+
+    # The two trees are disjoint, so scan them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        brave_future = executor.submit(_grep_test_classes, batch, _BRAVE_DIR)
+        chromium_future = executor.submit(
+            _grep_test_classes, batch, _CHROMIUM_DIR, (".", ":!brave")
+        )
+        in_brave = brave_future.result()
+        in_chromium = chromium_future.result()
+
+    if in_brave is None:
+        return
+    for name in batch:
+        if name in in_brave:
+            _test_location_cache[name] = "brave"
+        elif in_chromium is not None:
+            _test_location_cache[name] = (
+                "chromium" if name in in_chromium else "unknown"
+            )
+
+
+def _git_head(cwd):
+    """Return the HEAD commit of the git checkout at cwd, or None."""
+    try:
+        result = subprocess.run(
+            [_GIT, "rev-parse", "HEAD"],
+            cwd=cwd,
+            env=_GIT_ENV,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, NotADirectoryError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def load_test_location_cache():
+    """Seed the test location cache from disk.
+
+    Cached locations are only reused while src and src/brave are at the
+    same commits they were computed against.
+    """
+    global _test_location_cache_key
+    brave_head = _git_head(_BRAVE_DIR)
+    chromium_head = _git_head(_CHROMIUM_DIR)
+    if not brave_head or not chromium_head:
+        return
+    _test_location_cache_key = f"{chromium_head}:{brave_head}"
+
+    try:
+        with open(TEST_LOCATION_CACHE_PATH) as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return
+    if data.get("key") == _test_location_cache_key:
+        _test_location_cache.update(data.get("locations", {}))
+
+
+def save_test_location_cache():
+    """Write resolved test locations back to disk for the next run."""
+    if not _test_location_cache_key:
+        return
+    # 'unknown' may come from a timed out grep, so don't persist it
+    locations = {
+        name: location
+        for name, location in _test_location_cache.items()
+        if location != "unknown"
+    }
+    try:
+        os.makedirs(os.path.dirname(TEST_LOCATION_CACHE_PATH), exist_ok=True)
+        with open(TEST_LOCATION_CACHE_PATH, "w") as f:
+            json.dump(
+                {"key": _test_location_cache_key, "locations": locations}, f, indent=2
+            )
+            f.write("\n")
+    except OSError as e:
+        print(
+            f"WARNING: Could not write {TEST_LOCATION_CACHE_PATH}: {e}", file=sys.stderr
+        )
+
+
 def has_label(issue, label_name):
     """Check if an issue has a specific label."""
     labels = issue.get("labels", [])
@@ -109,6 +275,26 @@ def extract_disabled_test_name(title):
     return title.strip()
 
 
+def extract_test_name(title):
+    """Extract the test name from a test failure issue title."""
+    return TEST_FAILURE_PREFIX_RE.sub("", title).strip()
+
+
+def extract_disabled_test_class(test_name):
+    """Extract the test class from a disabled test name.
+    For parameterized tests like TestClass/TestClass.Method/1, use the class part."""
+    return test_name.split("/")[0] if "/" in test_name else test_name.split(".")[0]
+
+
+def get_test_class_name(issue):
+    """Return the test class whose location a story for this issue needs, or None."""
+    if is_disabled_test_issue(issue):
+        return extract_disabled_test_class(extract_disabled_test_name(issue["title"]))
+    if is_test_issue(issue):
+        return extract_test_name(issue["title"]).split(".")[0]
+    return None
+
+
 def extract_disabled_search_term(test_name):
     """Extract the method name to search for DISABLED_ prefix.
     Handles parameterized tests like TestClass/TestClass.Method/1 by
@@ -121,11 +307,41 @@ def extract_disabled_search_term(test_name):
     return name
 
 
+# Acceptance criteria that are the same for every story of a kind. Only the
+# entries mentioning the issue or test are built per story.
+_BEST_PRACTICES_CRITERION = (
+    "Read ./BEST-PRACTICES.md for async testing patterns and common pitfalls"
+)
+_BUILD_AND_FORMAT_CRITERIA = (
+    "Build the project (must pass)",
+    "Format the code (must pass)",
+)
+_PRESUBMIT_CRITERION = "Run presubmit checks (must pass)"
+_TEST_FIX_CRITERIA = (
+    "Analyze stack trace and identify root cause - determine whether this is a real bug in production code, a test-only issue, or both. Read the production code being tested, not just the test. If the test is catching a genuine bug, fix the production code",
+    "Implement fix targeting the correct layer (production code, test code, or both)",
+    *_BUILD_AND_FORMAT_CRITERIA,
+)
+_DISABLED_TEST_FIX_CRITERIA = (
+    "Use git blame on the line that disables the test to find the commit that disabled it, and read the commit message to understand WHY it was disabled",
+    "Investigate whether the original reason for disabling has been resolved (e.g., upstream fix landed, dependency updated, flaky infrastructure fixed)",
+    "If the underlying issue is fixed: re-enable the test by removing the DISABLED_ prefix. If the issue is NOT yet fixed: fix the root cause first, then re-enable the test",
+    *_BUILD_AND_FORMAT_CRITERIA,
+)
+_GENERIC_CRITERIA = (
+    "Analyze the issue and identify what needs to change",
+    "Implement the fix or feature",
+    *_BUILD_AND_FORMAT_CRITERIA,
+    "Find and run relevant tests to verify the change (must pass)",
+    _PRESUBMIT_CRITERION,
+)
+
+
 def build_test_story(story_id, priority, issue):
     """Build a user story for a test failure issue."""
     issue_num = issue["number"]
     title = issue["title"]
-    test_name = re.sub(r"^.*?failure:\s*", "", title, flags=re.IGNORECASE).strip()
+    test_name = extract_test_name(title)
     test_class_name = test_name.split(".")[0]
     test_location = find_test_location(test_class_name)
 
@@ -139,20 +355,18 @@ def build_test_story(story_id, priority, issue):
         )
 
     acceptance_criteria = [
-        "Read ./BEST-PRACTICES.md for async testing patterns and common pitfalls",
+        _BEST_PRACTICES_CRITERION,
         f"Fetch issue #{issue_num} details from {_issue_repo} GitHub API",
-        "Analyze stack trace and identify root cause - determine whether this is a real bug in production code, a test-only issue, or both. Read the production code being tested, not just the test. If the test is catching a genuine bug, fix the production code",
-        "Implement fix targeting the correct layer (production code, test code, or both)",
-        "Build the project (must pass)",
-        "Format the code (must pass)",
+        *_TEST_FIX_CRITERIA,
         f"Run the test: {test_binary} --gtest_filter={test_name} (must pass - run 5 times to verify consistency)",
-        "Run presubmit checks (must pass)",
+        _PRESUBMIT_CRITERION,
     ]
 
     return {
         "id": f"US-{story_id:03d}",
         "title": f"Fix test: {test_name}",
         "description": f"As a developer, I need to fix the intermittent failure in {test_name} (issue #{issue_num}).",
+        "issueNumber": issue_num,
         "testType": test_type,
         "testLocation": test_location,
         "testFilter": test_name,
@@ -172,11 +386,7 @@ def build_disabled_test_story(story_id, priority, issue):
     title = issue["title"]
     test_name = extract_disabled_test_name(title)
 
-    # For parameterized tests like TestClass/TestClass.Method/1, use the class part
-    class_part = (
-        test_name.split("/")[0] if "/" in test_name else test_name.split(".")[0]
-    )
-    test_location = find_test_location(class_part)
+    test_location = find_test_location(extract_disabled_test_class(test_name))
 
     # Determine test type heuristic
     if (
@@ -193,22 +403,19 @@ def build_disabled_test_story(story_id, priority, issue):
         )
 
     acceptance_criteria = [
-        "Read ./BEST-PRACTICES.md for async testing patterns and common pitfalls",
+        _BEST_PRACTICES_CRITERION,
         f"Fetch issue #{issue_num} details from {_issue_repo} GitHub API",
         f"Find where the test is disabled by searching for DISABLED_{extract_disabled_search_term(test_name)} in the source code using git grep",
-        "Use git blame on the line that disables the test to find the commit that disabled it, and read the commit message to understand WHY it was disabled",
-        "Investigate whether the original reason for disabling has been resolved (e.g., upstream fix landed, dependency updated, flaky infrastructure fixed)",
-        "If the underlying issue is fixed: re-enable the test by removing the DISABLED_ prefix. If the issue is NOT yet fixed: fix the root cause first, then re-enable the test",
-        "Build the project (must pass)",
-        "Format the code (must pass)",
+        *_DISABLED_TEST_FIX_CRITERIA,
         f"Run the test: {test_binary} --gtest_filter={test_name} (must pass - run 5 times to verify consistency)",
-        "Run presubmit checks (must pass)",
+        _PRESUBMIT_CRITERION,
     ]
 
     return {
         "id": f"US-{story_id:03d}",
         "title": f"Re-enable disabled test: {test_name}",
         "description": f"As a developer, I need to investigate and re-enable the disabled test {test_name} (issue #{issue_num}). The test was previously disabled and needs to be investigated to determine if the underlying issue is resolved, then re-enabled.",
+        "issueNumber": issue_num,
         "testType": test_type,
         "testLocation": test_location,
         "testFilter": test_name,
@@ -229,18 +436,14 @@ def build_generic_story(story_id, priority, issue):
 
     acceptance_criteria = [
         f"Fetch issue #{issue_num} details from {_issue_repo} GitHub API",
-        "Analyze the issue and identify what needs to change",
-        "Implement the fix or feature",
-        "Build the project (must pass)",
-        "Format the code (must pass)",
-        "Find and run relevant tests to verify the change (must pass)",
-        "Run presubmit checks (must pass)",
+        *_GENERIC_CRITERIA,
     ]
 
     return {
         "id": f"US-{story_id:03d}",
         "title": title,
         "description": f"Resolve issue #{issue_num}: {title}",
+        "issueNumber": issue_num,
         "acceptanceCriteria": acceptance_criteria,
         "priority": priority,
         "status": "pending",
@@ -251,82 +454,80 @@ def build_generic_story(story_id, priority, issue):
     }
 
 
-# Read GitHub issues and existing PRD
-if len(sys.argv) < 2:
-    print(
-        "Usage: cat github_issues.json | python3 update-prd-with-issues.py path/to/prd.json",
-        file=sys.stderr,
-    )
-    sys.exit(1)
-
-prd_path = sys.argv[1]
-
-# Read GitHub issues from stdin
-github_issues = json.loads(sys.stdin.read())
-
-# Read existing PRD or create empty structure
-if os.path.exists(prd_path):
-    with open(prd_path, "r") as f:
-        prd = json.load(f)
-else:
-    prd = {
+def load_prd(prd_path):
+    """Read an existing PRD, or create an empty one if it doesn't exist yet."""
+    if os.path.exists(prd_path):
+        with open(prd_path, "r") as f:
+            return json.load(f)
+    return {
         "projectName": f"{_project_name} Backlog",
         "description": f"Issues from {_issue_repo} repository to be resolved",
         "config": {},
         "stories": [],
     }
 
-# Detect which key the PRD uses for stories
-stories_key = "stories" if "stories" in prd else "stories"
-
-# Create a deep copy of existing stories for verification
-original_stories = copy.deepcopy(prd[stories_key])
-existing_story_count = len(prd[stories_key])
-
-# Extract existing issue numbers from PRD
-existing_issues = set()
-for story in prd[stories_key]:
-    desc = story["description"]
-    matches = re.findall(r"issue #(\d+)", desc)
-    for match in matches:
-        existing_issues.add(int(match))
-
-# Find the highest existing ID number and priority
-max_id = 0
-max_priority = 0
-for story in prd[stories_key]:
-    id_num = int(story["id"].split("-")[1])
-    if id_num > max_id:
-        max_id = id_num
-    if story["priority"] > max_priority:
-        max_priority = story["priority"]
-
-# Process each GitHub issue and add if missing
-new_stories = []
-for issue in github_issues:
-    issue_num = issue["number"]
 
-    # Skip if already in PRD
-    if issue_num in existing_issues:
-        continue
+def build_story(story_id, priority, issue):
+    """Build the user story matching the issue's type."""
+    if is_disabled_test_issue(issue):
+        return build_disabled_test_story(story_id, priority, issue)
+    if is_test_issue(issue):
+        return build_test_story(story_id, priority, issue)
+    return build_generic_story(story_id, priority, issue)
 
-    max_id += 1
-    max_priority += 1
 
-    if is_disabled_test_issue(issue):
-        story = build_disabled_test_story(max_id, max_priority, issue)
-    elif is_test_issue(issue):
-        story = build_test_story(max_id, max_priority, issue)
-    else:
-        story = build_generic_story(max_id, max_priority, issue)
+def add_issues_to_prd(prd, github_issues):
+    """Append stories for issues not already in the PRD.
 
-    new_stories.append(story)
+    Existing stories are never modified. Returns the list of new stories.
+    """
+    # Detect which key the PRD uses for stories
+    stories_key = "stories" if "stories" in prd else "stories"
+
+    existing_story_count = len(prd[stories_key])
+
+    # Extract existing issue numbers and the highest ID number and priority
+    # from the PRD in a single pass
+    existing_issues = set()
+    max_id = 0
+    max_priority = 0
+    for story in prd[stories_key]:
+        if "issueNumber" in story:
+            existing_issues.add(story["issueNumber"])
+        else:
+            # Stories created before issueNumber was recorded
+            existing_issues.update(
+                int(m) for m in ISSUE_RE.findall(story["description"])
+            )
+        id_num = int(story["id"].partition("-")[2])
+        if id_num > max_id:
+            max_id = id_num
+        if story["priority"] > max_priority:
+            max_priority = story["priority"]
+
+    # Skip issues already in PRD
+    new_issues = [
+        issue for issue in github_issues if issue["number"] not in existing_issues
+    ]
 
-# SAFETY CHECK: Verify existing stories were not modified
-for i in range(existing_story_count):
-    if prd[stories_key][i] != original_stories[i]:
+    # Resolve test locations for all new issues up front
+    prefetch_test_locations(
+        name for name in map(get_test_class_name, new_issues) if name
+    )
+
+    new_stories = [
+        build_story(max_id + i, max_priority + i, issue)
+        for i, issue in enumerate(new_issues, 1)
+    ]
+
+    # Add new stories to PRD (appends to end, doesn't modify existing)
+    prd[stories_key].extend(new_stories)
+
+    # SAFETY CHECK: The story builders never touch the PRD, so the only
+    # possible change is the appended tail
+    if len(prd[stories_key]) != existing_story_count + len(new_stories):
         print(
-            f"ERROR: Existing story {prd[stories_key][i]['id']} was modified!",
+            "ERROR: Existing stories were added or removed while updating the PRD!",
             file=sys.stderr,
         )
         print(
@@ -334,16 +535,35 @@ for i in range(existing_story_count):
         )
         sys.exit(1)
 
-# Add new stories to PRD (appends to end, doesn't modify existing)
-prd[stories_key].extend(new_stories)
+    return new_stories
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Add missing GitHub issues to a PRD as new user stories.",
+        epilog="Reads a JSON array of issues on stdin and writes the updated PRD to stdout.",
+    )
+    parser.add_argument("prd_path", help="Existing PRD to extend (created if missing)")
+    args = parser.parse_args()
+
+    # Read GitHub issues from stdin
+    github_issues = json.load(sys.stdin)
+
+    load_test_location_cache()
+    prd = load_prd(args.prd_path)
+    new_stories = add_issues_to_prd(prd, github_issues)
+    save_test_location_cache()
+
+    # Output updated PRD
+    json.dump(prd, sys.stdout, indent=2)
+    print()
+
+    # Print summary to stderr
+    print(f"\nAdded {len(new_stories)} new issues to PRD", file=sys.stderr)
+    for story in new_stories:
+        title = story.get("testFilter", story["title"])
+        print(f"  {story['id']}: {title} (#{story['issueNumber']})", file=sys.stderr)
 
-# Output updated PRD
-print(json.dumps(prd, indent=2))
 
-# Print summary to stderr
-print(f"\nAdded {len(new_stories)} new issues to PRD", file=sys.stderr)
-for story in new_stories:
-    issue_match = re.search(r"issue #(\d+)", story["description"])
-    issue_num = issue_match.group(1) if issue_match else "unknown"
-    title = story.get("testFilter", story["title"])
-    print(f"  {story['id']}: {title} (#{issue_num})", file=sys.stderr)
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@
 Handles all PR fetching, filtering, and cache checking in one script
 so the LLM doesn't burn tokens on this logic.
 
-Usage: fetch-prs.py [days|page<N>|#<PR>] [open|closed|all] [--reviewer-priority <username>] [--max-prs <N>]
+Usage: fetch-prs.py [days|page<N>|#<PR>...] [open|closed|all] [--reviewer-priority <username>] [--max-prs <N>]
 
 Examples:
   fetch-prs.py              # Default: 5 days, open PRs
@@ -13,15 +13,18 @@ Examples:
   fetch-prs.py 7 closed     # Last 7 days, closed PRs
   fetch-prs.py page1 all    # Page 1, all states
   fetch-prs.py #12345       # Single PR by number
+  fetch-prs.py #123 #456    # Several PRs by number (one GraphQL call)
   fetch-prs.py 12345        # Single PR by number (large numbers treated as PR#)
   fetch-prs.py 1 open --reviewer-priority user  # Prioritize PRs requesting review from user
   fetch-prs.py 1 open --max-prs 10              # Limit to 10 PRs per batch
 
-Output: JSON with "prs" array and "summary" stats.
+Output: JSON with "prs" array and "summary" stats (compact unless stdout
+is a terminal).
 """
 
 import json
 import os
+import re
 import subprocess
 import sys
 from datetime import datetime, timedelta, timezone
@@ -36,16 +39,25 @@ _config = load_config()
 PR_REPO = require_config(_config, "project.prRepository")
 
 CACHE_PATH = ".ignore/review-prs-cache.json"
+# GitHub's UTC timestamp format; fixed width, so such strings sort by time
+GITHUB_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 ORG_MEMBERS_PATH = ".ignore/org-members.txt"
 SKIP_PREFIXES = ["CI run for", "Backport", "Update l10n"]
 SKIP_CONTAINS = ["uplift to", "Just to test CI"]
+# Titles matching any of the above; add new patterns to the lists
+SKIP_TITLE_RE = re.compile(
+    "|".join(
+        [f"^(?:{'|'.join(map(re.escape, SKIP_PREFIXES))})"]
+        + [re.escape(pattern) for pattern in SKIP_CONTAINS]
+    )
+)
 
 
 def parse_args():
     mode = "days"
     days = 5
     page = None
-    pr_number = None
+    pr_numbers = []
     state = "open"
     reviewer_priority = None
     max_prs = None
@@ -64,26 +76,23 @@ def parse_args():
             continue
         elif arg.startswith("#"):
             mode = "single"
-            pr_number = int(arg[1:])
+            pr_numbers.append(int(arg[1:]))
         elif arg.startswith("page"):
             mode = "page"
             page = int(arg[4:])
         elif arg in ("open", "closed", "all"):
             state = arg
-        else:
-            try:
-                num = int(arg)
-                # Large numbers (>365) are PR numbers, not day counts
-                if num > 365:
-                    mode = "single"
-                    pr_number = num
-                else:
-                    days = num
-            except ValueError:
-                pass
+        elif arg.isdecimal():
+            num = int(arg)
+            # Large numbers (>365) are PR numbers, not day counts
+            if num > 365:
+                mode = "single"
+                pr_numbers.append(num)
+            else:
+                days = num
         i += 1
 
-    return mode, days, page, pr_number, state, reviewer_priority, max_prs
+    return mode, days, page, pr_numbers, state, reviewer_priority, max_prs
 
 
 def has_any_approval(pr):
@@ -116,6 +125,66 @@ def fetch_single_pr(pr_number):
     return [json.loads(result.stdout)]
 
 
+# Same fields as the gh pr list/view --json output used elsewhere
+_PR_GRAPHQL_FIELDS = """
+      number
+      title
+      updatedAt
+      isDraft
+      headRefOid
+      reviewDecision
+      author { login }
+      latestReviews(first: 100) { nodes { state author { login } } }
+      reviewRequests(first: 100) {
+        nodes {
+          requestedReviewer {
+            ... on User { login }
+            ... on Team { name }
+          }
+        }
+      }
+"""
+
+
+def fetch_prs_by_numbers(pr_numbers):
+    """Fetch several PRs in one aliased GraphQL query.
+
+    Returns PR dicts shaped like `gh pr view --json` output, in the order
+    requested. PRs that don't exist are reported on stderr and skipped.
+    """
+    owner, name = PR_REPO.split("/", 1)
+    aliases = "".join(
+        f"pr{num}: pullRequest(number: {num}) {{{_PR_GRAPHQL_FIELDS}}}\n"
+        for num in pr_numbers
+    )
+    query = f'query {{ repository(owner: "{owner}", name: "{name}") {{\n{aliases}}} }}'
+    cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    # gh exits non-zero if any alias errored (e.g. unknown PR), but the
+    # other PRs are still in the response
+    try:
+        repo = json.loads(result.stdout)["data"]["repository"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        raise subprocess.CalledProcessError(
+            result.returncode or 1, cmd, result.stdout, result.stderr
+        )
+
+    prs = []
+    for num in pr_numbers:
+        pr = repo.get(f"pr{num}")
+        if not pr:
+            print(f"WARNING: PR #{num} not found in {PR_REPO}", file=sys.stderr)
+            continue
+        pr["latestReviews"] = pr["latestReviews"]["nodes"]
+        pr["reviewRequests"] = [
+            node["requestedReviewer"]
+            for node in pr["reviewRequests"]["nodes"]
+            if node.get("requestedReviewer")
+        ]
+        prs.append(pr)
+    return prs
+
+
 def is_requested_reviewer(pr, username):
     """Check if the given username is a requested reviewer on the PR."""
     if not username:
@@ -129,9 +198,17 @@ def is_requested_reviewer(pr, username):
     return False
 
 
-def fetch_prs(mode, days, page, pr_number, state):
+def fetch_prs(mode, days, page, pr_numbers, state, updated_since=None):
+    """Fetch PRs from GitHub.
+
+    In days mode, drafts are excluded by GitHub's search. If updated_since
+    is given, GitHub is also asked to return only PRs updated at or after
+    that time.
+    """
     if mode == "single":
-        return fetch_single_pr(pr_number)
+        if len(pr_numbers) == 1:
+            return fetch_single_pr(pr_numbers[0])
+        return fetch_prs_by_numbers(list(dict.fromkeys(pr_numbers)))
 
     fields = "number,title,updatedAt,author,isDraft,headRefOid,reviewDecision,latestReviews,reviewRequests"
     base_cmd = [
@@ -159,8 +236,14 @@ def fetch_prs(mode, days, page, pr_number, state):
         start = (page - 1) * 20
         return prs[start : start + 20]
     else:
+        # filter_prs drops drafts anyway; don't download them
+        search = ["draft:false"]
+        if updated_since:
+            since = updated_since.astimezone(timezone.utc)
+            search.append(f"updated:>={since.strftime(GITHUB_TIME_FORMAT)}")
+        cmd = base_cmd + ["--limit", "500", "--search", " ".join(search)]
         result = subprocess.run(
-            base_cmd + ["--limit", "500"],
+            cmd,
             capture_output=True,
             text=True,
             check=True,
@@ -172,12 +255,32 @@ def fetch_prs(mode, days, page, pr_number, state):
         return prs
 
 
+_cache = None
+
+
 def load_cache():
-    try:
-        with open(CACHE_PATH) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+    """Load the review cache, reading the file at most once per process.
+
+    Callers must treat the returned dict as read-only; update-cache.py is
+    the only writer.
+    """
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_PATH) as f:
+                _cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _cache = {}
+    return _cache
+
+
+def cached_sha(cache, pr_num):
+    """Return the HEAD SHA last reviewed for pr_num, or None."""
+    entry = cache.get(pr_num)
+    # Older caches stored the bare SHA
+    if isinstance(entry, str):
+        return entry
+    return entry.get("sha") if entry else None
 
 
 def load_org_members():
@@ -194,13 +297,7 @@ def load_org_members():
 
 
 def should_skip_title(title):
-    for prefix in SKIP_PREFIXES:
-        if title.startswith(prefix):
-            return True
-    for pattern in SKIP_CONTAINS:
-        if pattern in title:
-            return True
-    return False
+    return SKIP_TITLE_RE.search(title) is not None
 
 
 def get_cutoff(mode, days, cache):
@@ -221,6 +318,9 @@ def get_cutoff(mode, days, cache):
 
 def filter_prs(prs, mode, days, cache, org_members, reviewer_priority=None):
     cutoff = get_cutoff(mode, days, cache)
+    if cutoff:
+        # Compared as strings against each PR's updatedAt
+        cutoff = cutoff.astimezone(timezone.utc).strftime(GITHUB_TIME_FORMAT)
     approved = set(cache.get("_approved", []))
 
     to_review = []
@@ -250,10 +350,11 @@ def filter_prs(prs, mode, days, cache, org_members, reviewer_priority=None):
                 continue
 
         if cutoff and mode == "days":
-            updated = datetime.fromisoformat(pr["updatedAt"].replace("Z", "+00:00"))
-            if updated < cutoff:
+            if pr["updatedAt"] < cutoff:
                 # Don't filter out PRs where the bot is explicitly requested
-                if not (reviewer_priority and is_requested_reviewer(pr, reviewer_priority)):
+                if not (
+                    reviewer_priority and is_requested_reviewer(pr, reviewer_priority)
+                ):
                     skipped_filtered += 1
                     continue
 
@@ -265,7 +366,7 @@ def filter_prs(prs, mode, days, cache, org_members, reviewer_priority=None):
             continue
 
         head_sha = pr.get("headRefOid", "")
-        if cache.get(pr_num) == head_sha:
+        if cached_sha(cache, pr_num) == head_sha:
             # If the bot is a requested reviewer, force a full re-review
             # even if the SHA hasn't changed (explicit re-request)
             if reviewer_priority and is_requested_reviewer(pr, reviewer_priority):
@@ -287,9 +388,28 @@ def filter_prs(prs, mode, days, cache, org_members, reviewer_priority=None):
     )
 
 
+def get_server_cutoff(mode, days, cache, reviewer_priority=None):
+    """Cutoff that can be applied by GitHub when fetching PRs, or None.
+
+    Not used with a reviewer priority, since PRs requesting that reviewer
+    are kept regardless of when they were last updated.
+    """
+    if reviewer_priority:
+        return None
+    return get_cutoff(mode, days, cache)
+
+
 def main():
-    mode, days, page, pr_number, state, reviewer_priority, max_prs = parse_args()
-    prs = fetch_prs(mode, days, page, pr_number, state)
+    mode, days, page, pr_numbers, state, reviewer_priority, max_prs = parse_args()
+    cache = {} if mode == "single" else load_cache()
+    prs = fetch_prs(
+        mode,
+        days,
+        page,
+        pr_numbers,
+        state,
+        get_server_cutoff(mode, days, cache, reviewer_priority),
+    )
 
     org_members = load_org_members()
 
@@ -302,7 +422,6 @@ def main():
         skipped_approved = 0
         skipped_external = 0
     else:
-        cache = load_cache()
         (
             to_review,
             cached_prs,
@@ -357,7 +476,11 @@ def main():
         },
     }
 
-    json.dump(output, sys.stdout, indent=2)
+    # Pretty-print for humans; compact when piped to the caller
+    if sys.stdout.isatty():
+        json.dump(output, sys.stdout, indent=2)
+    else:
+        json.dump(output, sys.stdout, separators=(",", ":"))
     print()
 
 
@@ -1054,10 +1054,16 @@ def main():
     # Temporarily override sys.argv for the fetch module
     old_argv = sys.argv
     sys.argv = ["fetch-prs.py"] + fetch_argv
-    mode, days, page, pr_number, state, rp, mp = _fp_mod.parse_args()
+    mode, days, page, pr_numbers, state, rp, mp = _fp_mod.parse_args()
     sys.argv = old_argv
 
-    raw_prs = _fp_mod.fetch_prs(mode, days, page, pr_number, state)
+    cache = {} if mode == "single" else _fp_mod.load_cache()
+    raw_prs = _fp_mod.fetch_prs(
+        mode, days, page, pr_numbers, state,
+        _fp_mod.get_server_cutoff(
+            mode, days, cache, bot_username if reviewer_priority else None
+        ),
+    )
     org_members = load_org_members()
 
     if mode == "single":
@@ -1074,7 +1080,6 @@ def main():
             "skipped_max_prs": 0,
         }
     else:
-        cache = _fp_mod.load_cache()
         (
             to_review, cached_prs_raw,
             skipped_filtered, skipped_cached,
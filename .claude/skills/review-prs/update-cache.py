@@ -5,6 +5,9 @@ Also updates _last_run timestamp so the next fetch-prs.py run uses it
 as the cutoff instead of a fixed N-day window. This prevents gaps if a
 cron run is missed.
 
+Each PR entry is {"sha": <head_ref_oid>, "ts": <iso time>}. Entries not
+touched for CACHE_TTL_DAYS are dropped on write so the file stays small.
+
 Usage:
   update-cache.py <pr_number> <head_ref_oid>            # Update SHA only
   update-cache.py <pr_number> <head_ref_oid> --approve   # Update SHA + mark approved
@@ -13,7 +16,8 @@ Usage:
 import json
 import os
 import sys
-from datetime import datetime, timezone
+import tempfile
+from datetime import datetime, timedelta, timezone
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 _bot_dir = os.path.join(_script_dir, "..", "..", "..")
@@ -34,6 +38,7 @@ head_ref_oid = args[1]
 approve = "--approve" in flags
 
 cache_path = ".ignore/review-prs-cache.json"
+CACHE_TTL_DAYS = 90
 
 try:
     with open(cache_path) as f:
@@ -42,17 +47,36 @@ except (FileNotFoundError, json.JSONDecodeError):
     cache = {}
     os.makedirs(os.path.dirname(cache_path), exist_ok=True)
 
-cache[pr_number] = head_ref_oid
-cache["_last_run"] = datetime.now(timezone.utc).isoformat()
+now = datetime.now(timezone.utc)
+expiry = (now - timedelta(days=CACHE_TTL_DAYS)).isoformat()
+for key, entry in list(cache.items()):
+    if key.startswith("_"):
+        continue
+    if isinstance(entry, str):
+        # Older caches stored the bare SHA; start its TTL now
+        cache[key] = {"sha": entry, "ts": now.isoformat()}
+    elif entry.get("ts", "") < expiry:
+        del cache[key]
+
+cache[pr_number] = {"sha": head_ref_oid, "ts": now.isoformat()}
+cache["_last_run"] = now.isoformat()
 
 if approve:
     approved = set(cache.get("_approved", []))
     approved.add(pr_number)
     cache["_approved"] = sorted(approved)
 
-with open(cache_path, "w") as f:
-    json.dump(cache, f, indent=2)
-    f.write("\n")
+# Write via a temp file so an interrupted run can't truncate the cache
+fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".json")
+try:
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, cache_path)
+except BaseException:
+    if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+    raise
 
 _config = load_config()
 _pr_repo = require_config(_config, "project.prRepository")
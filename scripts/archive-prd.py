@@ -5,11 +5,32 @@ Keeps only active work in the main PRD. Writes cleaned prd.json in-place
 (via temp file) and outputs a full recap to stdout.
 """
 
-import copy
 import json
 import os
 import sys
 import tempfile
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+
+
+def atomic_write_json(path, data):
+    """Write data as JSON to path via a temp file in the same directory.
+
+    The file is swapped in with os.replace, so a crash mid-write never
+    leaves a truncated file behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Clean up temp file if it exists
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 
 def main():
@@ -43,62 +64,51 @@ def main():
             print(f"WARNING: Could not read {archive_path}: {e}", file=sys.stderr)
             print("Starting with empty archive.", file=sys.stderr)
 
-    # Split stories into active and to-archive
+    # Split stories into active, merged and invalid in a single pass
     active_stories = []
-    archived_stories = []
+    merged = []
+    invalid = []
 
     for story in prd.get("stories", []):
-        if story.get("status") in ("merged", "invalid"):
-            archived_stories.append(story)
+        status = story.get("status")
+        if status == "merged":
+            merged.append(story)
+        elif status == "invalid":
+            invalid.append(story)
         else:
             active_stories.append(story)
 
+    archived_stories = merged + invalid
     if not archived_stories:
         print("No merged or invalid stories to archive. Nothing to do.")
         sys.exit(0)
 
     # Merge with existing archived stories (dedup by ID, latest wins)
-    archive_map = {s["id"]: s for s in old_stories}
-    for story in archived_stories:
-        archive_map[story["id"]] = story
-
-    all_archived = sorted(archive_map.values(), key=lambda s: s["id"])
+    archive_map = {s["id"]: s for s in chain(old_stories, archived_stories)}
+    all_archived = sorted(archive_map.values(), key=itemgetter("id"))
 
     # Build output structures
-    new_prd = copy.deepcopy(prd)
-    new_prd["stories"] = active_stories
+    new_prd = {**prd, "stories": active_stories}
 
     archive_data = {
         "stories": all_archived,
     }
 
-    # Write archive file
+    # Write archive file first, so a failure here leaves the PRD untouched
     try:
-        with open(archive_path, "w") as f:
-            json.dump(archive_data, f, indent=2)
-            f.write("\n")
+        atomic_write_json(archive_path, archive_data)
     except IOError as e:
         print(f"ERROR: Could not write {archive_path}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Write cleaned PRD atomically via temp file
+    # Write cleaned PRD
     try:
-        fd, tmp_path = tempfile.mkstemp(dir=prd_dir, suffix=".json")
-        with os.fdopen(fd, "w") as f:
-            json.dump(new_prd, f, indent=2)
-            f.write("\n")
-        os.replace(tmp_path, prd_path)
+        atomic_write_json(prd_path, new_prd)
     except IOError as e:
         print(f"ERROR: Could not write {prd_path}: {e}", file=sys.stderr)
-        # Clean up temp file if it exists
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
         sys.exit(1)
 
     # Print recap
-    merged = [s for s in archived_stories if s.get("status") == "merged"]
-    invalid = [s for s in archived_stories if s.get("status") == "invalid"]
-
     print("# PRD Cleaning Recap\n")
     print("## Summary")
     print(
@@ -121,10 +131,7 @@ def main():
         print()
 
     # Count active stories by status
-    status_counts = {}
-    for s in active_stories:
-        st = s.get("status", "unknown")
-        status_counts[st] = status_counts.get(st, 0) + 1
+    status_counts = Counter(s.get("status", "unknown") for s in active_stories)
 
     print(f"## Active Stories Remaining ({len(active_stories)} total)\n")
     for st in ("pending", "committed", "pushed", "skipped"):
@@ -55,6 +55,14 @@ def check_prd_has_work():
     )
 
 
+@pytest.fixture
+def archive_prd():
+    return _load_module(
+        "archive_prd",
+        os.path.join(SCRIPTS_DIR, "archive-prd.py"),
+    )
+
+
 @pytest.fixture
 def chunk_best_practices():
     return _load_module(
@@ -63,6 +71,22 @@ def chunk_best_practices():
     )
 
 
+@pytest.fixture
+def fetch_prs():
+    return _load_module(
+        "fetch_prs",
+        os.path.join(SKILLS_DIR, "review-prs", "fetch-prs.py"),
+    )
+
+
+@pytest.fixture
+def update_prd_with_issues():
+    return _load_module(
+        "update_prd_with_issues",
+        os.path.join(SKILLS_DIR, "add-backlog-to-prd", "update-prd-with-issues.py"),
+    )
+
+
 # --- Temp file helpers ---
 
 
@@ -0,0 +1,187 @@
+"""Tests for fetch-prs.py.
+
+Covers: argument parsing, batched PR lookup, PR filtering and the cutoff
+passed to GitHub.
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+# ═══════════════════════════════════════════════════════════════════════════
+# parse_args
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestParseArgs:
+    def test_defaults(self, fetch_prs, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["fetch-prs.py"])
+        assert fetch_prs.parse_args() == ("days", 5, None, [], "open", None, None)
+
+    def test_multiple_pr_numbers(self, fetch_prs, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["fetch-prs.py", "#123", "45678", "all"])
+        mode, _, _, pr_numbers, state, _, _ = fetch_prs.parse_args()
+        assert mode == "single"
+        assert pr_numbers == [123, 45678]
+        assert state == "all"
+
+    def test_day_count_and_unknown_args(self, fetch_prs, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["fetch-prs.py", "3", "bogus", "-1"])
+        mode, days, _, pr_numbers, _, _, _ = fetch_prs.parse_args()
+        assert (mode, days, pr_numbers) == ("days", 3, [])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# fetch_prs_by_numbers
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestFetchPrsByNumbers:
+    def test_single_query_normalized_to_gh_shape(self, fetch_prs, monkeypatch):
+        calls = []
+        response = {
+            "data": {
+                "repository": {
+                    "pr2": {
+                        "number": 2,
+                        "author": {"login": "dev"},
+                        "latestReviews": {"nodes": [{"state": "APPROVED"}]},
+                        "reviewRequests": {
+                            "nodes": [
+                                {"requestedReviewer": {"login": "bot"}},
+                                {"requestedReviewer": {"name": "team"}},
+                                {"requestedReviewer": None},
+                            ]
+                        },
+                    },
+                    "pr1": None,
+                }
+            },
+            "errors": [{"message": "Could not resolve to a PullRequest"}],
+        }
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 1, json.dumps(response), "")
+
+        monkeypatch.setattr(fetch_prs.subprocess, "run", fake_run)
+        prs = fetch_prs.fetch_prs_by_numbers([2, 1])
+
+        assert len(calls) == 1
+        assert "pr1: pullRequest(number: 1)" in calls[0][-1]
+        assert [pr["number"] for pr in prs] == [2]
+        assert prs[0]["latestReviews"] == [{"state": "APPROVED"}]
+        assert prs[0]["reviewRequests"] == [{"login": "bot"}, {"name": "team"}]
+        assert fetch_prs.has_any_approval(prs[0])
+        assert fetch_prs.is_requested_reviewer(prs[0], "team")
+
+    def test_raises_without_data(self, fetch_prs, monkeypatch):
+        def fake_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 1, "", "HTTP 401")
+
+        monkeypatch.setattr(fetch_prs.subprocess, "run", fake_run)
+        try:
+            fetch_prs.fetch_prs_by_numbers([1, 2])
+        except subprocess.CalledProcessError as e:
+            assert e.stderr == "HTTP 401"
+        else:
+            raise AssertionError("expected CalledProcessError")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# should_skip_title
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestShouldSkipTitle:
+    def test_skip_prefix(self, fetch_prs):
+        assert fetch_prs.should_skip_title("CI run for #123")
+        assert fetch_prs.should_skip_title("Backport foo")
+
+    def test_prefix_only_matches_at_start(self, fetch_prs):
+        assert not fetch_prs.should_skip_title("Fix Backport handling")
+
+    def test_skip_contains(self, fetch_prs):
+        assert fetch_prs.should_skip_title("Fix crash (uplift to 1.70.x)")
+
+    def test_regular_title(self, fetch_prs):
+        assert not fetch_prs.should_skip_title("Fix crash in wallet")
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# get_server_cutoff
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGetServerCutoff:
+    def test_uses_last_run_in_days_mode(self, fetch_prs):
+        cache = {"_last_run": "2026-01-02T03:04:05+00:00"}
+        cutoff = fetch_prs.get_server_cutoff("days", 5, cache)
+        assert cutoff == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    def test_none_outside_days_mode(self, fetch_prs):
+        assert fetch_prs.get_server_cutoff("page", 5, {}) is None
+
+    def test_none_with_reviewer_priority(self, fetch_prs):
+        # Requested-reviewer PRs are kept even when older than the cutoff
+        assert fetch_prs.get_server_cutoff("days", 5, {}, "bot") is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# filter_prs
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def make_pr(number, updated_at, **overrides):
+    pr = {
+        "number": number,
+        "title": f"PR {number}",
+        "updatedAt": updated_at,
+        "author": {"login": "dev"},
+        "isDraft": False,
+        "headRefOid": f"sha{number}",
+        "reviewRequests": [],
+    }
+    pr.update(overrides)
+    return pr
+
+
+class TestFilterPrs:
+    def test_days_mode_filters_by_last_run(self, fetch_prs):
+        cache = {"_last_run": "2026-01-02T03:04:05.123456+00:00"}
+        prs = [
+            make_pr(1, "2026-01-02T03:04:06Z"),
+            make_pr(2, "2026-01-02T03:04:04Z"),
+        ]
+        to_review, _, skipped_filtered, *_ = fetch_prs.filter_prs(
+            prs, "days", 5, cache, set()
+        )
+        assert [pr["number"] for pr in to_review] == [1]
+        assert skipped_filtered == 1
+
+    def test_last_run_in_other_timezone(self, fetch_prs):
+        cache = {"_last_run": "2026-01-02T05:04:05+02:00"}
+        prs = [make_pr(1, "2026-01-02T04:30:00Z")]
+        to_review, *_ = fetch_prs.filter_prs(prs, "days", 5, cache, set())
+        assert [pr["number"] for pr in to_review] == [1]
+
+    def test_requested_reviewer_kept_past_cutoff(self, fetch_prs):
+        cache = {"_last_run": "2026-01-02T03:04:05+00:00"}
+        prs = [make_pr(1, "2025-12-01T00:00:00Z", reviewRequests=[{"login": "bot"}])]
+        to_review, *_ = fetch_prs.filter_prs(prs, "days", 5, cache, set(), "bot")
+        assert [pr["number"] for pr in to_review] == [1]
+
+    def test_cached_sha_entries_and_legacy_strings(self, fetch_prs):
+        cache = {
+            "1": {"sha": "sha1", "ts": "2026-01-02T03:04:05+00:00"},
+            "2": "sha2",
+            "3": {"sha": "old", "ts": "2026-01-02T03:04:05+00:00"},
+        }
+        prs = [make_pr(n, "2026-01-02T03:04:06Z") for n in (1, 2, 3)]
+        to_review, cached_prs, _, skipped_cached, *_ = fetch_prs.filter_prs(
+            prs, "page", 5, cache, set()
+        )
+        assert [pr["number"] for pr in to_review] == [3]
+        assert [pr["number"] for pr in cached_prs] == [1, 2]
+        assert skipped_cached == 2
@@ -1,7 +1,7 @@
 """Tests for all Python scripts in brave-dev-bot.
 
 Covers: update-prd-status.py, select-task.py, business-hours-elapsed.py,
-and check-prd-has-work.py.
+check-prd-has-work.py, and archive-prd.py.
 """
 
 import os
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta, timezone
 
 SCRIPT_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "scripts")
 UPDATE_PRD_SCRIPT = os.path.join(SCRIPT_DIR, "update-prd-status.py")
+ARCHIVE_PRD_SCRIPT = os.path.join(SCRIPT_DIR, "archive-prd.py")
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -560,3 +561,62 @@ class TestCheckPrdHasWork:
 
     def test_empty_stories(self):
         assert self._active([]) == []
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# archive-prd.py
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestArchivePrd:
+    def _run(self, prd_path):
+        result = subprocess.run(
+            [sys.executable, ARCHIVE_PRD_SCRIPT, prd_path],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode, result.stdout, result.stderr
+
+    def test_moves_merged_and_invalid_to_archive(self, tmp_dir, write_json, read_json):
+        prd_path = write_json(
+            "prd.json",
+            {
+                "config": {"workingDirectory": "src/brave"},
+                "stories": [
+                    make_story("merged", id="US-001"),
+                    make_story("pending", id="US-002"),
+                    make_story("invalid", id="US-003"),
+                ],
+            },
+        )
+        write_json(
+            "prd.archived.json", {"stories": [make_story("merged", id="US-000")]}
+        )
+
+        code, stdout, _ = self._run(prd_path)
+        assert code == 0
+        assert "Merged (1 stories)" in stdout
+
+        prd = read_json(prd_path)
+        assert prd["config"] == {"workingDirectory": "src/brave"}
+        assert [s["id"] for s in prd["stories"]] == ["US-002"]
+        archive = read_json(os.path.join(tmp_dir, "prd.archived.json"))
+        assert [s["id"] for s in archive["stories"]] == ["US-000", "US-001", "US-003"]
+
+    def test_nothing_to_archive(self, write_json, read_json):
+        prd_path = write_json("prd.json", {"stories": [make_story("pending")]})
+        code, stdout, _ = self._run(prd_path)
+        assert code == 0
+        assert "Nothing to do" in stdout
+        assert len(read_json(prd_path)["stories"]) == 1
+
+    def test_atomic_write_keeps_old_file_on_failure(
+        self, archive_prd, tmp_dir, write_json, read_json
+    ):
+        path = write_json("prd.json", {"stories": []})
+        try:
+            archive_prd.atomic_write_json(path, {"bad": object()})
+        except TypeError:
+            pass
+        assert read_json(path) == {"stories": []}
+        assert os.listdir(tmp_dir) == ["prd.json"]
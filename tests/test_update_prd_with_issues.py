@@ -0,0 +1,155 @@
+"""Tests for update-prd-with-issues.py.
+
+Covers: test name extraction, batched test location lookup, and
+appending new issues to an existing PRD.
+"""
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Test name extraction
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestExtractTestName:
+    def test_test_failure_prefix(self, update_prd_with_issues):
+        name = update_prd_with_issues.extract_test_name("Test failure: Foo.Bar")
+        assert name == "Foo.Bar"
+
+    def test_intermittent_prefix_case_insensitive(self, update_prd_with_issues):
+        name = update_prd_with_issues.extract_test_name(
+            "Intermittent upstream unittest FAILURE:  Foo.Bar"
+        )
+        assert name == "Foo.Bar"
+
+    def test_test_class_for_test_issue(self, update_prd_with_issues):
+        issue = {"number": 1, "title": "Test failure: FooTest.Bar", "labels": []}
+        assert update_prd_with_issues.get_test_class_name(issue) == "FooTest"
+
+    def test_test_class_for_parameterized_disabled_test(self, update_prd_with_issues):
+        issue = {
+            "number": 1,
+            "title": "Disabled test: All/FooTest.Bar/1",
+            "labels": [],
+        }
+        assert update_prd_with_issues.get_test_class_name(issue) == "All"
+
+    def test_no_test_class_for_generic_issue(self, update_prd_with_issues):
+        issue = {"number": 1, "title": "Crash on startup", "labels": []}
+        assert update_prd_with_issues.get_test_class_name(issue) is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# prefetch_test_locations
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def fake_grep(brave_hits, chromium_hits, calls):
+    """Build a _grep_test_classes replacement backed by fixed hit sets."""
+
+    def _grep(names, cwd, pathspec=()):
+        calls.append(list(names))
+        hits = chromium_hits if pathspec else brave_hits
+        if hits is None:
+            return None
+        return set(names) & hits
+
+    return _grep
+
+
+class TestPrefetchTestLocations:
+    def test_resolves_all_classes_in_one_batch(self, update_prd_with_issues):
+        calls = []
+        update_prd_with_issues._grep_test_classes = fake_grep(
+            {"AdsTest"}, {"AdsTest", "ChromeTest"}, calls
+        )
+        update_prd_with_issues.prefetch_test_locations(
+            ["AdsTest", "ChromeTest", "MissingTest", "AdsTest"]
+        )
+        assert len(calls) == 2
+        assert update_prd_with_issues._test_location_cache == {
+            "AdsTest": "brave",
+            "ChromeTest": "chromium",
+            "MissingTest": "unknown",
+        }
+
+    def test_brave_prefixed_classes_skip_git_grep(self, update_prd_with_issues):
+        calls = []
+        update_prd_with_issues._grep_test_classes = fake_grep(set(), set(), calls)
+        update_prd_with_issues.prefetch_test_locations(["BraveAdsBrowserTest"])
+        assert calls == []
+        assert update_prd_with_issues.find_test_location("BraveAdsBrowserTest") == (
+            "brave"
+        )
+
+    def test_overlapping_names_left_for_per_class_lookup(self, update_prd_with_issues):
+        calls = []
+        update_prd_with_issues._grep_test_classes = fake_grep({"Ads"}, set(), calls)
+        update_prd_with_issues.prefetch_test_locations(["Ads", "AdsBrowserTest"])
+        assert all("AdsBrowserTest" not in names for names in calls)
+        assert "AdsBrowserTest" not in update_prd_with_issues._test_location_cache
+
+    def test_failed_brave_grep_seeds_nothing(self, update_prd_with_issues):
+        update_prd_with_issues._grep_test_classes = fake_grep(None, {"ChromeTest"}, [])
+        update_prd_with_issues.prefetch_test_locations(["ChromeTest"])
+        assert update_prd_with_issues._test_location_cache == {}
+
+    def test_failed_chromium_grep_keeps_brave_hits(self, update_prd_with_issues):
+        update_prd_with_issues._grep_test_classes = fake_grep({"AdsTest"}, None, [])
+        update_prd_with_issues.prefetch_test_locations(["AdsTest", "ChromeTest"])
+        assert update_prd_with_issues._test_location_cache == {"AdsTest": "brave"}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# add_issues_to_prd
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestAddIssuesToPrd:
+    def test_appends_only_missing_issues(self, update_prd_with_issues):
+        existing = {
+            "id": "US-007",
+            "title": "Old",
+            "description": "Resolve issue #10: Old",
+            "priority": 3,
+            "status": "pending",
+        }
+        prd = {"stories": [dict(existing)]}
+        issues = [
+            {"number": 10, "title": "Old", "labels": []},
+            {"number": 11, "title": "New", "labels": []},
+        ]
+        new_stories = update_prd_with_issues.add_issues_to_prd(prd, issues)
+        assert [s["id"] for s in new_stories] == ["US-008"]
+        assert new_stories[0]["priority"] == 4
+        assert prd["stories"][0] == existing
+        assert prd["stories"][1] is new_stories[0]
+
+    def test_existing_issue_detected_by_issue_number(self, update_prd_with_issues):
+        # e.g. follow-up stories whose description doesn't mention the issue
+        prd = {
+            "stories": [
+                {
+                    "id": "US-001",
+                    "title": "Follow-up",
+                    "description": "Follow-up from US-000 PR #5: cleanup",
+                    "issueNumber": 42,
+                    "priority": 1,
+                }
+            ]
+        }
+        issues = [{"number": 42, "title": "Cleanup", "labels": []}]
+        assert update_prd_with_issues.add_issues_to_prd(prd, issues) == []
+
+    def test_new_stories_record_issue_number(self, update_prd_with_issues):
+        prd = {"stories": []}
+        issues = [{"number": 99, "title": "Crash on startup", "labels": []}]
+        (story,) = update_prd_with_issues.add_issues_to_prd(prd, issues)
+        assert story["issueNumber"] == 99
+
+    def test_test_issue_uses_prefetched_location(self, update_prd_with_issues):
+        update_prd_with_issues._grep_test_classes = fake_grep({"FooTest"}, set(), [])
+        prd = {"stories": []}
+        issues = [{"number": 1, "title": "Test failure: FooTest.Bar", "labels": []}]
+        (story,) = update_prd_with_issues.add_issues_to_prd(prd, issues)
+        assert story["testLocation"] == "brave"
+        assert story["testFilter"] == "FooTest.Bar"
+        assert any("brave_browser_tests" in c for c in story["acceptanceCriteria"])